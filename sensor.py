@@ -1,5 +1,8 @@
 """WeatherKit sensors."""
 
+from functools import cached_property
+from typing import NamedTuple
+
 from apple_weatherkit import DataSetType
 
 from homeassistant.components.sensor import (
@@ -10,7 +13,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfVolumetricFlux
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import translation
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -35,6 +38,15 @@ SENSORS = (
     ),
 )
 
+# Templates from strings.json - use these directly to ensure placeholders work.
+# Keyed by (starts now, lasts a single minute) of a precipitation period.
+FORECAST_TEMPLATES_BY_SHAPE = {
+    (True, True): "{precipitation} now",
+    (True, False): "{precipitation} for the next {duration} minutes",
+    (False, True): "{precipitation} in {minutes} minutes",
+    (False, False): "{precipitation} starting in {start_minutes} minutes, lasting {duration} minutes",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,6 +70,75 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+class Period(NamedTuple):
+    """A run of consecutive minutes with precipitation."""
+
+    start: int
+    end: int
+    type: str
+    max_intensity: float
+
+
+def _compute_periods(minutes: list[dict]) -> list[Period]:
+    """Find the precipitation periods in minute-by-minute forecast data."""
+    # Most updates have no precipitation at all, so skip the period tracking
+    for minute in minutes:
+        if minute.get("precipitationIntensity", 0.0) > 0.0:
+            break
+    else:
+        return []
+
+    precipitation_periods = []
+    current_period_start = None
+    current_period_type = None
+    current_period_max_intensity = 0.0
+
+    for i, minute in enumerate(minutes):
+        intensity = minute.get("precipitationIntensity", 0.0)
+
+        if intensity > 0.0:
+            # Only minutes with precipitation need their type
+            precip_type = minute.get("precipitationType", "clear")
+            # Check if precipitation is starting
+            if current_period_start is None:
+                current_period_start = i
+                current_period_type = precip_type
+                current_period_max_intensity = intensity
+            # Precipitation continues
+            else:
+                current_period_max_intensity = max(
+                    current_period_max_intensity, intensity
+                )
+                if precip_type != "clear":
+                    current_period_type = precip_type
+        # Check if precipitation stops
+        elif intensity == 0.0 and current_period_start is not None:
+            precipitation_periods.append(
+                Period(
+                    current_period_start,
+                    i - 1,
+                    current_period_type,
+                    current_period_max_intensity,
+                )
+            )
+            current_period_start = None
+            current_period_type = None
+            current_period_max_intensity = 0.0
+
+    # Handle case where precipitation continues to the end
+    if current_period_start is not None:
+        precipitation_periods.append(
+            Period(
+                current_period_start,
+                len(minutes) - 1,
+                current_period_type,
+                current_period_max_intensity,
+            )
+        )
+
+    return precipitation_periods
+
+
 class WeatherKitSensor(
     CoordinatorEntity[WeatherKitDataUpdateCoordinator], WeatherKitEntity, SensorEntity
 ):
@@ -70,15 +151,14 @@ class WeatherKitSensor(
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        WeatherKitEntity.__init__(
-            self, coordinator, unique_id_suffix=entity_description.key
-        )
+        WeatherKitEntity.__init__(self, coordinator, entity_description.key)
         self.entity_description = entity_description
+        self._data_key = entity_description.key
 
     @property
     def native_value(self) -> StateType:
         """Return native value from coordinator current weather."""
-        return self.coordinator.data[ATTR_CURRENT_WEATHER][self.entity_description.key]
+        return self.coordinator.data[ATTR_CURRENT_WEATHER][self._data_key]
 
 
 class WeatherKitNextHourForecastSensor(
@@ -87,6 +167,7 @@ class WeatherKitNextHourForecastSensor(
     """WeatherKit NextHourForecast sensor entity."""
 
     _attr_translation_key = "next_hour_forecast"
+    _state_key_prefix = f"component.{DOMAIN}.entity.sensor.next_hour_forecast.state."
 
     def __init__(
         self,
@@ -94,11 +175,23 @@ class WeatherKitNextHourForecastSensor(
     ) -> None:
         """Initialize the NextHourForecast sensor."""
         super().__init__(coordinator)
-        WeatherKitEntity.__init__(
-            self, coordinator, unique_id_suffix="next_hour_forecast"
+        WeatherKitEntity.__init__(self, coordinator, "next_hour_forecast")
+        # Supported data sets are fixed once the first refresh has resolved them
+        self._expect_next_hour = bool(
+            coordinator.supported_data_sets
+            and DataSetType.NEXT_HOUR_FORECAST in coordinator.supported_data_sets
         )
+        self._periods_cache: tuple[dict, list[Period]] | None = None
+        self._translations_cache: tuple[str, dict[str, str]] | None = None
 
-    @property
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the values derived from the previous coordinator data."""
+        for name in ("native_value", "icon", "extra_state_attributes"):
+            self.__dict__.pop(name, None)
+        super()._handle_coordinator_update()
+
+    @cached_property
     def native_value(self) -> StateType:
         """Return a human-readable forecast summary."""
         if not self.coordinator.last_update_success:
@@ -111,11 +204,7 @@ class WeatherKitNextHourForecastSensor(
 
         if ATTR_FORECAST_NEXT_HOUR not in self.coordinator.data:
             # Log a warning if data set is supported but data is missing
-            if (
-                self.coordinator.supported_data_sets
-                and DataSetType.NEXT_HOUR_FORECAST
-                in self.coordinator.supported_data_sets
-            ):
+            if self._expect_next_hour:
                 LOGGER.warning(
                     "Next hour forecast data set is supported but not in API response"
                 )
@@ -125,123 +214,53 @@ class WeatherKitNextHourForecastSensor(
         if not next_hour_data:
             return self._translate_state("no_precipitation")
 
-        minutes = next_hour_data.get("minutes", [])
-
-        if not minutes:
-            return self._translate_state("no_precipitation")
-
-        # Only consider the next 60 minutes, even if API returns more
-        minutes = minutes[:60]
-
-        return self._generate_forecast_summary(minutes)
-
-    def _generate_forecast_summary(self, minutes: list[dict]) -> str:
-        """Generate a human-readable forecast summary from minute-by-minute data."""
-        # Find when precipitation starts and stops
-        precipitation_periods = []
-        current_period_start = None
-        current_period_type = None
-        current_period_max_intensity = 0.0
+        return self._generate_forecast_summary(
+            self._precipitation_periods(next_hour_data)
+        )
 
-        for i, minute in enumerate(minutes):
-            intensity = minute.get("precipitationIntensity", 0.0)
-            precip_type = minute.get("precipitationType", "clear")
+    def _precipitation_periods(self, next_hour_data: dict) -> list[Period]:
+        """Return the precipitation periods for the given next hour data.
 
-            # Check if precipitation is starting
-            if intensity > 0.0 and current_period_start is None:
-                current_period_start = i
-                current_period_type = precip_type
-                current_period_max_intensity = intensity
-            # Check if precipitation continues
-            elif intensity > 0.0 and current_period_start is not None:
-                current_period_max_intensity = max(
-                    current_period_max_intensity, intensity
-                )
-                if precip_type != "clear":
-                    current_period_type = precip_type
-            # Check if precipitation stops
-            elif intensity == 0.0 and current_period_start is not None:
-                precipitation_periods.append(
-                    {
-                        "start": current_period_start,
-                        "end": i - 1,
-                        "type": current_period_type,
-                        "max_intensity": current_period_max_intensity,
-                    }
-                )
-                current_period_start = None
-                current_period_type = None
-                current_period_max_intensity = 0.0
+        The result is cached against the identity of the next hour data, which
+        the coordinator replaces on every refresh, so the state and the icon
+        share a single scan of the minute-by-minute forecast.
+        """
+        if (
+            self._periods_cache is not None
+            and self._periods_cache[0] is next_hour_data
+        ):
+            return self._periods_cache[1]
 
-        # Handle case where precipitation continues to the end
-        if current_period_start is not None:
-            precipitation_periods.append(
-                {
-                    "start": current_period_start,
-                    "end": len(minutes) - 1,
-                    "type": current_period_type,
-                    "max_intensity": current_period_max_intensity,
-                }
-            )
+        # Only consider the next 60 minutes, even if API returns more
+        periods = _compute_periods(next_hour_data.get("minutes", [])[:60])
+        self._periods_cache = (next_hour_data, periods)
+        return periods
 
-        # Generate summary text
+    def _generate_forecast_summary(self, precipitation_periods: list[Period]) -> str:
+        """Generate a human-readable forecast summary from precipitation periods."""
         if not precipitation_periods:
             return self._translate_state("no_precipitation")
 
         summary_parts = []
         for period in precipitation_periods:
-            start_minute = period["start"]
-            end_minute = period["end"]
-            duration = end_minute - start_minute + 1
-            precip_type = period["type"]
-            max_intensity = period["max_intensity"]
-
-            # Get translated precipitation description
-            precip_desc_key = self._get_precipitation_description_key(
-                precip_type, max_intensity
-            )
-            precip_desc = self._translate_state(precip_desc_key)
-
-            # Build the description using translations
-            if start_minute == 0:
-                if duration == 1:
-                    summary_parts.append(
-                        self._translate_forecast("now", {"precipitation": precip_desc})
-                    )
-                else:
-                    summary_parts.append(
-                        self._translate_forecast(
-                            "for_next_minutes",
-                            {"precipitation": precip_desc, "duration": str(duration)},
-                        )
-                    )
-            elif duration == 1:
-                summary_parts.append(
-                    self._translate_forecast(
-                        "in_minutes",
-                        {
-                            "precipitation": precip_desc,
-                            "minutes": str(start_minute),
-                        },
-                    )
+            start_minute = period.start
+            duration = period.end - start_minute + 1
+            precip_desc = self._translate_state(
+                self._get_precipitation_description_key(
+                    period.type, period.max_intensity
                 )
-            else:
-                summary_parts.append(
-                    self._translate_forecast(
-                        "starting_in_minutes_lasting",
-                        {
-                            "precipitation": precip_desc,
-                            "start_minutes": str(start_minute),
-                            "duration": str(duration),
-                        },
-                    )
+            )
+            template = FORECAST_TEMPLATES_BY_SHAPE[(start_minute == 0, duration == 1)]
+            summary_parts.append(
+                template.format(
+                    precipitation=precip_desc,
+                    duration=duration,
+                    minutes=start_minute,
+                    start_minutes=start_minute,
                 )
+            )
 
-        return (
-            "; ".join(summary_parts)
-            if summary_parts
-            else self._translate_state("no_precipitation")
-        )
+        return "; ".join(summary_parts)
 
     def _get_precipitation_description_key(
         self, precip_type: str, max_intensity: float
@@ -268,38 +287,27 @@ class WeatherKitNextHourForecastSensor(
 
     def _translate_state(self, state_key: str) -> str:
         """Translate a state key."""
-        translations = translation.async_get_cached_translations(
-            self.hass, self.hass.config.language, "entity", DOMAIN
+        return self._translations().get(
+            self._state_key_prefix + state_key, state_key.replace("_", " ").title()
         )
-        translation_key = (
-            f"component.{DOMAIN}.entity.sensor.next_hour_forecast.state.{state_key}"
+
+    def _translations(self) -> dict[str, str]:
+        """Return the entity translations for the configured language."""
+        language = self.hass.config.language
+        if self._translations_cache is not None:
+            cached_language, translations = self._translations_cache
+            if cached_language == language:
+                return translations
+
+        translations = translation.async_get_cached_translations(
+            self.hass, language, "entity", DOMAIN
         )
-        return translations.get(translation_key, state_key.replace("_", " ").title())
-
-    def _translate_forecast(self, key: str, placeholders: dict[str, str]) -> str:
-        """Translate a forecast pattern with placeholders."""
-        # Templates from strings.json - use these directly to ensure placeholders work
-        templates = {
-            "now": "{precipitation} now",
-            "for_next_minutes": "{precipitation} for the next {duration} minutes",
-            "in_minutes": "{precipitation} in {minutes} minutes",
-            "starting_in_minutes_lasting": "{precipitation} starting in {start_minutes} minutes, lasting {duration} minutes",
-        }
-
-        template = templates.get(key, key.replace("_", " "))
-
-        try:
-            return template.format(**placeholders)
-        except (KeyError, ValueError) as e:
-            LOGGER.warning(
-                "Failed to format forecast template '%s' with placeholders %s: %s",
-                key,
-                placeholders,
-                e,
-            )
-            return template
+        # Translations may not be loaded yet, so only keep a populated result
+        if translations:
+            self._translations_cache = (language, translations)
+        return translations
 
-    @property
+    @cached_property
     def icon(self) -> str | None:
         """Return the icon based on the forecast."""
         if (
@@ -308,72 +316,18 @@ class WeatherKitNextHourForecastSensor(
         ):
             return "mdi:weather-partly-cloudy"
 
-        # Check if it's currently daylight or nighttime
-        current_weather = self.coordinator.data.get(ATTR_CURRENT_WEATHER, {})
-        is_daylight = current_weather.get("daylight", True)
-
-        next_hour_data = self.coordinator.data[ATTR_FORECAST_NEXT_HOUR]
-        minutes = next_hour_data.get("minutes", [])
-
-        if not minutes:
-            # No precipitation expected - use day/night appropriate icon
-            return "mdi:weather-sunny" if is_daylight else "mdi:weather-night"
-
-        # Use the same logic as _generate_forecast_summary to find precipitation periods
-        precipitation_periods = []
-        current_period_start = None
-        current_period_type = None
-        current_period_max_intensity = 0.0
-
-        for i, minute in enumerate(minutes):
-            intensity = minute.get("precipitationIntensity", 0.0)
-            precip_type = minute.get("precipitationType", "clear")
-
-            # Check if precipitation is starting
-            if intensity > 0.0 and current_period_start is None:
-                current_period_start = i
-                current_period_type = precip_type
-                current_period_max_intensity = intensity
-            # Check if precipitation continues
-            elif intensity > 0.0 and current_period_start is not None:
-                current_period_max_intensity = max(
-                    current_period_max_intensity, intensity
-                )
-                if precip_type != "clear":
-                    current_period_type = precip_type
-            # Check if precipitation stops
-            elif intensity == 0.0 and current_period_start is not None:
-                precipitation_periods.append(
-                    {
-                        "start": current_period_start,
-                        "end": i - 1,
-                        "type": current_period_type,
-                        "max_intensity": current_period_max_intensity,
-                    }
-                )
-                current_period_start = None
-                current_period_type = None
-                current_period_max_intensity = 0.0
-
-        # Handle case where precipitation continues to the end
-        if current_period_start is not None:
-            precipitation_periods.append(
-                {
-                    "start": current_period_start,
-                    "end": len(minutes) - 1,
-                    "type": current_period_type,
-                    "max_intensity": current_period_max_intensity,
-                }
-            )
+        precipitation_periods = self._precipitation_periods(
+            self.coordinator.data[ATTR_FORECAST_NEXT_HOUR]
+        )
 
         # Get the first precipitation period to determine icon
         if not precipitation_periods:
             # No precipitation found - use day/night appropriate icon
-            return "mdi:weather-sunny" if is_daylight else "mdi:weather-night"
+            return self._sun_icon()
 
         first_period = precipitation_periods[0]
-        precip_type = first_period["type"]
-        max_intensity = first_period["max_intensity"]
+        precip_type = first_period.type
+        max_intensity = first_period.max_intensity
 
         # Determine icon based on precipitation type and intensity
         if precip_type == "rain":
@@ -390,7 +344,14 @@ class WeatherKitNextHourForecastSensor(
             return "mdi:weather-hail"
         return "mdi:weather-rainy"
 
-    @property
+    def _sun_icon(self) -> str:
+        """Return the clear sky icon for the current time of day."""
+        current_weather = self.coordinator.data.get(ATTR_CURRENT_WEATHER, {})
+        if current_weather.get("daylight", True):
+            return "mdi:weather-sunny"
+        return "mdi:weather-night"
+
+    @cached_property
     def extra_state_attributes(self) -> dict[str, StateType]:
         """Return additional state attributes with minute-by-minute forecast."""
         if (
@@ -411,7 +372,9 @@ class WeatherKitNextHourForecastSensor(
         # Add minute-by-minute forecast data
         minutes = next_hour_data.get("minutes", [])
         if minutes:
-            # Store as a list of dictionaries for each minute
+            # Store as a list of dictionaries for each minute. Templates and cards
+            # read these by field name, so the shape is kept as is; the list is
+            # only rebuilt once per coordinator update.
             attributes["minutes"] = [
                 {
                     "start_time": minute.get("startTime"),
@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 from apple_weatherkit import DataSetType
 
-from homeassistant.components.weatherkit.const import (
+from custom_components.custom_weatherkit.const import (
     CONF_KEY_ID,
     CONF_KEY_PEM,
     CONF_SERVICE_ID,
@@ -15,7 +15,10 @@ from homeassistant.components.weatherkit.const import (
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant
 
-from tests.common import MockConfigEntry, load_json_object_fixture
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    load_json_object_fixture,
+)
 
 EXAMPLE_CONFIG_DATA = {
     CONF_LATITUDE: 35.4690101707532,
@@ -33,9 +36,10 @@ def mock_weather_response(
     has_hourly_forecast: bool = True,
     has_daily_forecast: bool = True,
     has_next_hour_forecast: bool = True,
+    next_hour_minutes: list[dict] | None = None,
 ):
     """Mock a successful WeatherKit API response."""
-    weather_response = load_json_object_fixture("weatherkit/weather_response.json")
+    weather_response = load_json_object_fixture("weather_response.json")
 
     available_data_sets = [DataSetType.CURRENT_WEATHER]
 
@@ -57,14 +61,16 @@ def mock_weather_response(
         del weather_response["forecastNextHour"]
     else:
         available_data_sets.append(DataSetType.NEXT_HOUR_FORECAST)
+        if next_hour_minutes is not None:
+            weather_response["forecastNextHour"]["minutes"] = next_hour_minutes
 
     with (
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_weather_data",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_weather_data",
             return_value=weather_response,
         ),
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_availability",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_availability",
             return_value=available_data_sets,
         ),
     ):
@@ -6,10 +6,15 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading this custom integration in all tests."""
+
+
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock]:
     """Override async_setup_entry."""
     with patch(
-        "homeassistant.components.weatherkit.async_setup_entry", return_value=True
+        "custom_components.custom_weatherkit.async_setup_entry", return_value=True
     ) as mock_setup_entry:
         yield mock_setup_entry
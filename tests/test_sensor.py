@@ -1,13 +1,36 @@
 """Sensor entity tests for the WeatherKit integration."""
 
+from datetime import timedelta
 from typing import Any
+from unittest.mock import patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.core import HomeAssistant
 
+from custom_components.custom_weatherkit.sensor import Period, _compute_periods
+
 from . import init_integration, mock_weather_response
 
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    load_json_object_fixture,
+)
+
+
+def _minutes(intensities: list[float], precip_type: str = "rain") -> list[dict]:
+    """Build minute forecasts with the given precipitation intensities."""
+    return [
+        {
+            "startTime": f"2023-09-08T22:{minute:02d}:04Z",
+            "precipitationIntensity": intensity,
+            "precipitationChance": 0.5 if intensity else 0.0,
+            "precipitationType": precip_type if intensity else "clear",
+        }
+        for minute, intensity in enumerate(intensities)
+    ]
+
 
 @pytest.mark.parametrize(
     ("entity_name", "expected_value"),
@@ -35,9 +58,8 @@ async def test_next_hour_forecast_sensor(hass: HomeAssistant) -> None:
 
     state = hass.states.get("sensor.home_next_hour_forecast")
     assert state
-    assert state.state == "0.5"
-    assert state.attributes["device_class"] == "precipitation_intensity"
-    assert state.attributes["unit_of_measurement"] == "mm/h"
+    assert state.state == "Light rain for the next 5 minutes"
+    assert state.attributes["icon"] == "mdi:weather-rainy"
     assert state.attributes["forecast_start"] == "2023-09-08T22:03:04Z"
     assert state.attributes["forecast_end"] == "2023-09-08T23:03:04Z"
     assert state.attributes["minute_count"] == 6
@@ -51,6 +73,143 @@ async def test_next_hour_forecast_sensor(hass: HomeAssistant) -> None:
     assert first_minute["precipitation_type"] == "rain"
 
 
+@pytest.mark.parametrize(
+    ("minutes", "expected_state", "expected_icon"),
+    [
+        (_minutes([0.5]), "Light rain now", "mdi:weather-rainy"),
+        (
+            _minutes([0.5, 0.5, 0.5]),
+            "Light rain for the next 3 minutes",
+            "mdi:weather-rainy",
+        ),
+        (
+            _minutes([0, 0, 0, 0, 0, 0.5]),
+            "Light rain in 5 minutes",
+            "mdi:weather-rainy",
+        ),
+        (
+            _minutes([0, 0, 0, 0, 0, 0.5, 0.5, 0.5]),
+            "Light rain starting in 5 minutes, lasting 3 minutes",
+            "mdi:weather-rainy",
+        ),
+        (
+            _minutes([0.5, 0, 0, 3.0]),
+            "Light rain now; Moderate rain in 3 minutes",
+            "mdi:weather-rainy",
+        ),
+        (_minutes([2.49]), "Light rain now", "mdi:weather-rainy"),
+        (_minutes([2.5]), "Moderate rain now", "mdi:weather-pouring"),
+        (_minutes([9.99]), "Moderate rain now", "mdi:weather-pouring"),
+        (_minutes([10.0]), "Heavy rain now", "mdi:weather-pouring"),
+        (_minutes([0.5], "snow"), "Light snow now", "mdi:weather-snowy"),
+        (_minutes([2.5], "snow"), "Moderate snow now", "mdi:weather-snowy-heavy"),
+        (_minutes([10.0], "sleet"), "Heavy sleet now", "mdi:weather-snowy-rainy"),
+        (_minutes([0.5], "hail"), "Light hail now", "mdi:weather-hail"),
+        (_minutes([0.5], "mixed"), "Light precipitation now", "mdi:weather-rainy"),
+        (_minutes([12.0], "mixed"), "Heavy precipitation now", "mdi:weather-rainy"),
+        (_minutes([0] * 60), "No precipitation expected", "mdi:weather-sunny"),
+        (_minutes([]), "No precipitation expected", "mdi:weather-sunny"),
+        # Only the next 60 minutes are considered
+        (
+            _minutes([0] * 60 + [5.0] * 5),
+            "No precipitation expected",
+            "mdi:weather-sunny",
+        ),
+        (
+            _minutes([0] * 58 + [5.0] * 5),
+            "Moderate rain starting in 58 minutes, lasting 2 minutes",
+            "mdi:weather-pouring",
+        ),
+    ],
+)
+async def test_next_hour_forecast_summary(
+    hass: HomeAssistant,
+    minutes: list[dict],
+    expected_state: str,
+    expected_icon: str,
+) -> None:
+    """Test the NextHourForecast summary and icon for different forecasts."""
+    with mock_weather_response(next_hour_minutes=minutes):
+        await init_integration(hass)
+
+    state = hass.states.get("sensor.home_next_hour_forecast")
+    assert state
+    assert state.state == expected_state
+    assert state.attributes["icon"] == expected_icon
+
+
+async def test_next_hour_forecast_sensor_night_icon(hass: HomeAssistant) -> None:
+    """Test the NextHourForecast icon without precipitation at night."""
+    with mock_weather_response(is_night_time=True, next_hour_minutes=_minutes([0])):
+        await init_integration(hass)
+
+    state = hass.states.get("sensor.home_next_hour_forecast")
+    assert state
+    assert state.attributes["icon"] == "mdi:weather-night"
+
+
+@pytest.mark.parametrize(
+    ("minutes", "expected_periods"),
+    [
+        ([], []),
+        ([{}], []),
+        (_minutes([0, 0, 0]), []),
+        # Precipitation continuing to the last minute
+        (_minutes([0, 1.0, 2.0]), [Period(1, 2, "rain", 2.0)]),
+        (
+            _minutes([1.0, 0, 0.5, 3.0, 0]),
+            [Period(0, 0, "rain", 1.0), Period(2, 3, "rain", 3.0)],
+        ),
+        # A period starting as "clear" takes the type reported later on
+        (
+            [
+                {"precipitationIntensity": 1.0, "precipitationType": "clear"},
+                {"precipitationIntensity": 0.5, "precipitationType": "snow"},
+                {"precipitationIntensity": 0.2, "precipitationType": "clear"},
+                {"precipitationIntensity": 0.0, "precipitationType": "clear"},
+            ],
+            [Period(0, 2, "snow", 1.0)],
+        ),
+        (
+            [{"precipitationIntensity": 1.0, "precipitationType": "clear"}],
+            [Period(0, 0, "clear", 1.0)],
+        ),
+        ([{"precipitationIntensity": 1.0}], [Period(0, 0, "clear", 1.0)]),
+    ],
+)
+def test_compute_periods(minutes: list[dict], expected_periods: list[Period]) -> None:
+    """Test finding precipitation periods in minute-by-minute data."""
+    assert _compute_periods(minutes) == expected_periods
+
+
+async def test_next_hour_forecast_sensor_follows_updates(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test that the NextHourForecast sensor is recomputed after a data update."""
+    with mock_weather_response(has_next_hour_forecast=True):
+        await init_integration(hass)
+
+    weather_response = load_json_object_fixture("weather_response.json")
+    for minute in weather_response["forecastNextHour"]["minutes"]:
+        minute["precipitationIntensity"] = 0.0
+        minute["precipitationType"] = "clear"
+
+    with patch(
+        "custom_components.custom_weatherkit.WeatherKitApiClient.get_weather_data",
+        return_value=weather_response,
+    ):
+        freezer.tick(timedelta(minutes=5))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.home_next_hour_forecast")
+    assert state
+    assert state.state == "No precipitation expected"
+    assert state.attributes["icon"] == "mdi:weather-sunny"
+    assert state.attributes["minutes"][0]["precipitation_intensity"] == 0.0
+
+
 async def test_next_hour_forecast_sensor_not_available(hass: HomeAssistant) -> None:
     """Test that NextHourForecast sensor is not created when data is unavailable."""
     with mock_weather_response(has_next_hour_forecast=False):
@@ -7,13 +7,13 @@ from apple_weatherkit.client import (
     WeatherKitApiClientError,
 )
 
-from homeassistant.components.weatherkit.const import DOMAIN
+from custom_components.custom_weatherkit.const import DOMAIN
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 
 from . import EXAMPLE_CONFIG_DATA
 
-from tests.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 
 async def test_auth_error_handling(hass: HomeAssistant) -> None:
@@ -27,11 +27,11 @@ async def test_auth_error_handling(hass: HomeAssistant) -> None:
 
     with (
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_weather_data",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_weather_data",
             side_effect=WeatherKitApiClientAuthenticationError,
         ),
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_availability",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_availability",
             side_effect=WeatherKitApiClientAuthenticationError,
         ),
     ):
@@ -53,11 +53,11 @@ async def test_client_error_handling(hass: HomeAssistant) -> None:
 
     with (
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_weather_data",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_weather_data",
             side_effect=WeatherKitApiClientError,
         ),
         patch(
-            "homeassistant.components.weatherkit.WeatherKitApiClient.get_availability",
+            "custom_components.custom_weatherkit.WeatherKitApiClient.get_availability",
             side_effect=WeatherKitApiClientError,
         ),
     ):
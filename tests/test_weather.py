@@ -19,7 +19,7 @@ from homeassistant.components.weather import (
     SERVICE_GET_FORECASTS,
     WeatherEntityFeature,
 )
-from homeassistant.components.weatherkit.const import ATTRIBUTION
+from custom_components.custom_weatherkit.const import ATTRIBUTION
 from homeassistant.const import ATTR_ATTRIBUTION, ATTR_SUPPORTED_FEATURES
 from homeassistant.core import HomeAssistant
 